@@ -3,6 +3,7 @@
 """Moves the "web" folder into webdiffs, giving it a unique name to identify it"""
 
 import argparse
+import concurrent.futures
 import datetime
 import inspect
 import os
@@ -42,9 +43,42 @@ def is_ipython():
     return True
 
 
+def read_git_head(repo_dir):
+    """Resolve HEAD to a commit hash by reading the .git dir directly, without launching git
+
+    Only handles the simple case of a standard .git dir at the root of repo_dir; raises OSError or ValueError if it
+    can't resolve the hash, in which case callers should fall back to `git rev-parse`.
+    """
+    git_dir = os.path.join(repo_dir, ".git")
+    if not os.path.isdir(git_dir):
+        # .git file (ie, worktrees / submodules) or not a repo root
+        raise FileNotFoundError(f"no .git dir in {repo_dir}")
+    with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf8") as reader:
+        head = reader.read().strip()
+    if not head.startswith("ref: "):
+        # detached HEAD
+        return head
+    ref = head[len("ref: ") :]
+    ref_path = os.path.join(git_dir, *ref.split("/"))
+    if os.path.isfile(ref_path):
+        with open(ref_path, "r", encoding="utf8") as reader:
+            return reader.read().strip()
+    with open(os.path.join(git_dir, "packed-refs"), "r", encoding="utf8") as reader:
+        for line in reader:
+            if line.startswith(("#", "^")):
+                continue
+            githash, _, name = line.strip().partition(" ")
+            if name == ref:
+                return githash
+    raise ValueError(f"could not find ref {ref!r} in {git_dir}")
+
+
 def get_git_hash(repo_dir, n=8):
-    proc = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo_dir, text=True, capture_output=True)
-    githash = proc.stdout.strip()
+    try:
+        githash = read_git_head(repo_dir)
+    except (OSError, ValueError):
+        proc = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo_dir, text=True, capture_output=True)
+        githash = proc.stdout.strip()
     if n:
         githash = githash[:n]
     return githash
@@ -58,9 +92,10 @@ def get_git_hash(repo_dir, n=8):
 def archive_web(name: str):
     now = datetime.datetime.now()
     date = now.strftime("%Y-%m-%d")
-    luxtest_hash = get_git_hash(THIS_DIR)
-    renders_hash = get_git_hash(luxtest_utils.get_renders_root())
-    usd_hash = get_git_hash(USD_REPO)
+    repo_dirs = (THIS_DIR, luxtest_utils.get_renders_root(), USD_REPO)
+    # each git invocation is dominated by process startup, so run them all at once
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(repo_dirs)) as executor:
+        luxtest_hash, renders_hash, usd_hash = executor.map(get_git_hash, repo_dirs)
     dest_name = f"{date}.{name}.luxtest-{luxtest_hash}.usd-{usd_hash}.renders-{renders_hash}"
     dest_path = os.path.join(WEB_ARCHIVE_DIR, dest_name)
 
@@ -69,6 +104,8 @@ def archive_web(name: str):
     print("to:")
     print(f"  {dest_path}")
 
+    # make sure the archive dir exists, so shutil.move can just rename (rather than copy + delete the whole tree)
+    os.makedirs(WEB_ARCHIVE_DIR, exist_ok=True)
     shutil.move(WEB_DIR, dest_path)
 
 
@@ -3,6 +3,7 @@
 """CLI interface to does_something"""
 
 import argparse
+import concurrent.futures
 import inspect
 import os
 import re
@@ -10,6 +11,8 @@ import subprocess
 import sys
 import traceback
 
+from typing import Iterable
+
 THIS_FILE = os.path.abspath(inspect.getsourcefile(lambda: None) or __file__)
 THIS_DIR = os.path.dirname(THIS_FILE)
 
@@ -22,7 +25,10 @@ from luxtest_const import RENDERERS
 
 RENDER_DIRS = luxtest_utils.get_render_dirs()
 
+INPUT_NAME_PREFIX = "iesTest-"
+INPUT_NAME_SUFFIX = ".exr"
 INPUT_NAME_RE = re.compile(r"""^iesTest-(?P<renderer>.*)\.(?P<camera>iesTop|iesBottom).(?P<frame>\d{4}).exr$""")
+
 ###############################################################################
 # Utilities
 ###############################################################################
@@ -39,11 +45,20 @@ def is_ipython():
 if sys.platform == "win32":
     to_shell_cmd = subprocess.list2cmdline
 else:
+    import shlex
+
+    to_shell_cmd = shlex.join
 
-    def to_shell_cmd(cmd_list):
-        import shlex
 
-        return " ".join(shlex.quote(x) for x in cmd_list)
+def to_frames_spec(frames: Iterable[int]) -> str:
+    """Convert frames into an oiiotool --frames spec, ie: 1-3,5,7-9"""
+    ranges = []
+    for frame in sorted(frames):
+        if ranges and ranges[-1][1] == frame - 1:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return ",".join(str(start) if start == end else f"{start}-{end}" for start, end in ranges)
 
 
 ###############################################################################
@@ -53,6 +68,7 @@ else:
 
 def combine_ies_test_images(renderers=(), delete=True):
     to_delete = []
+    jobs = []
     if not renderers:
         renderers = RENDERERS
     renders_root = luxtest_utils.get_renders_root()
@@ -62,21 +78,21 @@ def combine_ies_test_images(renderers=(), delete=True):
         top_frames = {}
         bottom_frames = {}
         for entry in os.scandir(renderer_dir):
+            # cheap string checks first, so we only run the regex on likely candidates
+            name = entry.name
+            if not (name.startswith(INPUT_NAME_PREFIX) and name.endswith(INPUT_NAME_SUFFIX)):
+                continue
             if not entry.is_file():
                 continue
-            match = INPUT_NAME_RE.match(entry.name)
+            match = INPUT_NAME_RE.match(name)
             if not match:
                 continue
-            frame_dict = {
-                "iesTop": top_frames,
-                "iesBottom": bottom_frames,
-            }[match.group("camera")]
-            if match.group("renderer") != renderer:
+            if match["renderer"] != renderer:
                 raise RuntimeError(
-                    f"found file {entry.path} with renderer {match.group('renderer')} in renderer dir {renderer_dir}"
+                    f"found file {entry.path} with renderer {match['renderer']} in renderer dir {renderer_dir}"
                 )
-            frame = match.group("frame")
-            frame_dict[frame] = entry
+            frame_dict = top_frames if match["camera"] == "iesTop" else bottom_frames
+            frame_dict[match["frame"]] = entry
 
         top_set = set(top_frames)
         bottom_set = set(bottom_frames)
@@ -94,20 +110,48 @@ def combine_ies_test_images(renderers=(), delete=True):
                 print(f"  {entry.path}")
             print()
         both = sorted(top_set.intersection(bottom_set))
+        if not both:
+            continue
+
+        # process all frames with a single oiiotool call, using its frame-sequence wildcards ("#" = 4-digit frame)
+        top_pattern = os.path.join(renderer_dir, f"iesTest-{renderer}.iesTop.#.exr")
+        bottom_pattern = os.path.join(renderer_dir, f"iesTest-{renderer}.iesBottom.#.exr")
+        output_pattern = os.path.join(renderer_dir, f"iesTest-{renderer}.#.exr")
+        frames_spec = to_frames_spec(int(x) for x in both)
+        args = [
+            "oiiotool",
+            "--frames",
+            frames_spec,
+            top_pattern,
+            bottom_pattern,
+            "--mosaic",
+            "1x2",
+            "-o",
+            output_pattern,
+        ]
+        outputs = [os.path.join(renderer_dir, f"iesTest-{renderer}.{frame}.exr") for frame in both]
+        jobs.append((args, outputs))
         for frame in both:
-            top_path = top_frames[frame].path
-            bottom_path = bottom_frames[frame].path
-            output_path = os.path.join(renderer_dir, f"iesTest-{renderer}.{frame}.exr")
-            args = ["oiiotool", top_path, bottom_path, "--mosaic", "1x2", "-o", output_path]
+            to_delete.append(top_frames[frame].path)
+            to_delete.append(bottom_frames[frame].path)
+
+    # renderers are independent, so run their oiiotool procs in parallel
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = []
+        for args, outputs in jobs:
             print(to_shell_cmd(args), flush=True)
-            subprocess.check_call(args)
-            print(f"Output: {output_path}")
-            to_delete.append(top_path)
-            to_delete.append(bottom_path)
+            futures.append((executor.submit(subprocess.check_call, args), outputs))
+        for future, outputs in futures:
+            future.result()
+            for output_path in outputs:
+                print(f"Output: {output_path}")
+
     if delete:
         for path in to_delete:
             print(f"removing: {path}")
-            os.remove(path)
+        # unlinks are latency-bound on network filesystems, so issue several at once
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(os.remove, to_delete))
 
 
 ###############################################################################
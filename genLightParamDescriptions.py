@@ -3,16 +3,22 @@
 """Generate .json file describing the various parameters for each light"""
 
 import argparse
+import bisect
 import collections.abc
+import concurrent.futures
 import dataclasses
+import functools
 import inspect
+import itertools
 import json
 import math
+import operator
 import os
 import sys
 import traceback
+import types
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeAlias, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeAlias, Union
 
 THIS_FILE = os.path.abspath(inspect.getsourcefile(lambda: None) or __file__)
 THIS_DIR = os.path.dirname(THIS_FILE)
@@ -23,14 +29,21 @@ if THIS_DIR not in sys.path:
 from luxtest_utils import FrameRange
 
 try:
-    from pxr import Sdf, Usd, UsdLux
+    from pxr import Gf, Sdf, Usd, UsdLux
 except ImportError:
     import pip_import
 
     pip_import.pip_import("pxr", "usd-core")
-    from pxr import Sdf, Usd, UsdLux
+    from pxr import Gf, Sdf, Usd, UsdLux
 
 import luxtest_const
+import luxtest_utils
+
+try:
+    import orjson
+except ImportError:
+    # optional - much faster parsing, but we can fall back to stdlib json
+    orjson = None
 
 IntFloat: TypeAlias = Union[int, float]
 
@@ -45,8 +58,26 @@ LIGHT_NAME_SUFFIX = "_light"
 OUTPUT_JSON_PATH = os.path.join(THIS_DIR, "light_descriptions.json")
 USD_EXTENSIONS = (".usd", ".usda", ".usdc")
 
+# per-usd-file results are cached next to the output json, in <output>.cache.json - bump SCHEMA_VERSION whenever
+# the description format changes. The cache is also invalidated whenever any of CACHE_SOURCE_PATHS (the code that
+# computes the descriptions, and the overrides it uses) change
+CACHE_SUFFIX = ".cache.json"
+SCHEMA_VERSION = 1
+CACHE_SOURCE_PATHS = (
+    THIS_FILE,
+    os.path.abspath(luxtest_const.__file__),
+    os.path.abspath(luxtest_utils.__file__),
+)
+
 MISSING = object()
 
+# if set, re-run full FrameGroupTracker.validate() after every combine - slow (quadratic in number of frames), but
+# useful for debugging
+VALIDATE_ALL = bool(os.environ.get("LUXTEST_VALIDATE"))
+
+# cache of attribute fallback values, keyed by (prim type, applied schemas, attr name) - see get_fallback
+_FALLBACK_CACHE: Dict[Tuple[str, Tuple[str, ...], str], Any] = {}
+
 AREA_LIGHT_SUMMARY_OVERRIDES = {
     FrameRange(1, 5): "light rotate worldZ from 0 to 60",
     FrameRange(26, 30): "light rotate under shear + nonuniform scale",
@@ -66,12 +97,93 @@ SUMMARY_OVERRIDES = {
     },
 }
 
+# all area lights share a single read-only view, rather than each having their own copy
+_AREA_LIGHT_SUMMARY_OVERRIDES_VIEW = types.MappingProxyType(AREA_LIGHT_SUMMARY_OVERRIDES)
 for area_light in ("sphere", "disk", "cylinder", "rect"):
-    SUMMARY_OVERRIDES[area_light] = dict(AREA_LIGHT_SUMMARY_OVERRIDES)
+    SUMMARY_OVERRIDES[area_light] = _AREA_LIGHT_SUMMARY_OVERRIDES_VIEW
 del area_light
 
 SUMMARY_OVERRIDES["iesLibPreview"] = SUMMARY_OVERRIDES["iesTest"]
 
+
+def _sort_override_ranges(summary_overrides) -> Dict[str, Tuple[List[int], List[FrameRange]]]:
+    sorted_ranges = {}
+    sorted_by_id = {}
+    for light_name, light_overrides in summary_overrides.items():
+        if id(light_overrides) not in sorted_by_id:
+            ranges = sorted(light_overrides)
+            for prev, next_range in itertools.pairwise(ranges):
+                if next_range.start <= prev.end:
+                    raise ValueError(
+                        f"overlapping summary override frame ranges for {light_name}: {prev} and {next_range}"
+                    )
+            sorted_by_id[id(light_overrides)] = ([x.start for x in ranges], ranges)
+        sorted_ranges[light_name] = sorted_by_id[id(light_overrides)]
+    return sorted_ranges
+
+
+# for each light, the starts of its override ranges, and the ranges themselves, sorted - see get_override_group
+# lights sharing the same overrides mapping also share the same sorted ranges
+SORTED_OVERRIDE_RANGES = _sort_override_ranges(SUMMARY_OVERRIDES)
+
+# scalar types whose values may be compared with math.isclose
+FLOAT_TYPE_NAMES = (
+    Sdf.ValueTypeNames.Float,
+    Sdf.ValueTypeNames.Double,
+    Sdf.ValueTypeNames.Half,
+)
+
+# float vector types (json-ified as flat lists of floats) whose values may be compared element-wise with math.isclose
+FLOAT_VEC_TYPE_NAMES = (
+    Sdf.ValueTypeNames.Float2,
+    Sdf.ValueTypeNames.Float3,
+    Sdf.ValueTypeNames.Float4,
+    Sdf.ValueTypeNames.Double2,
+    Sdf.ValueTypeNames.Double3,
+    Sdf.ValueTypeNames.Double4,
+    Sdf.ValueTypeNames.Half2,
+    Sdf.ValueTypeNames.Half3,
+    Sdf.ValueTypeNames.Half4,
+    Sdf.ValueTypeNames.Color3f,
+    Sdf.ValueTypeNames.Color3d,
+    Sdf.ValueTypeNames.Color3h,
+    Sdf.ValueTypeNames.Color4f,
+    Sdf.ValueTypeNames.Color4d,
+    Sdf.ValueTypeNames.Color4h,
+    Sdf.ValueTypeNames.Vector3f,
+    Sdf.ValueTypeNames.Vector3d,
+    Sdf.ValueTypeNames.Vector3h,
+    Sdf.ValueTypeNames.Normal3f,
+    Sdf.ValueTypeNames.Normal3d,
+    Sdf.ValueTypeNames.Normal3h,
+    Sdf.ValueTypeNames.Point3f,
+    Sdf.ValueTypeNames.Point3d,
+    Sdf.ValueTypeNames.Point3h,
+    Sdf.ValueTypeNames.TexCoord2f,
+    Sdf.ValueTypeNames.TexCoord2d,
+    Sdf.ValueTypeNames.TexCoord2h,
+    Sdf.ValueTypeNames.TexCoord3f,
+    Sdf.ValueTypeNames.TexCoord3d,
+    Sdf.ValueTypeNames.TexCoord3h,
+)
+
+# scalar types whose values may be compared with ==
+EXACT_TYPE_NAMES = (
+    Sdf.ValueTypeNames.Bool,
+    Sdf.ValueTypeNames.Int,
+    Sdf.ValueTypeNames.UInt,
+    Sdf.ValueTypeNames.Int64,
+    Sdf.ValueTypeNames.UInt64,
+    Sdf.ValueTypeNames.UChar,
+    Sdf.ValueTypeNames.String,
+    Sdf.ValueTypeNames.Token,
+    Sdf.ValueTypeNames.Asset,
+)
+
+# all Gf vector / matrix types, for fast exact-type checks
+GF_VEC_TYPES = frozenset(getattr(Gf, x) for x in dir(Gf) if x.startswith("Vec"))
+GF_MATRIX_TYPES = frozenset(getattr(Gf, x) for x in dir(Gf) if x.startswith("Matrix"))
+
 COLOR_NAMES = {
     (0.0, 0.0, 0.0): "black",
     (1.0, 1.0, 1.0): "white",
@@ -102,22 +214,14 @@ def is_iterable(obj) -> bool:
 
 
 def is_sorted(vals: Iterable):
-    last = MISSING
-    for current in vals:
-        if last is MISSING:
-            last = current
-        elif last > current:
-            return False
-    return True
+    return all(a <= b for a, b in itertools.pairwise(vals))
 
 
 def _standardize_val_for_comparison(val):
-    if type(val).__name__.startswith("Matrix"):
-        flat = []
-        for vec in val:
-            flat.extend(list(vec))
-        return flat
-    elif type(val).__name__.startswith("Vec"):
+    val_type = type(val)
+    if val_type in GF_MATRIX_TYPES:
+        return [x for vec in val for x in vec]
+    elif val_type in GF_VEC_TYPES:
         return list(val)
     if isinstance(val, (str, bytes)):
         return val
@@ -130,6 +234,11 @@ def _standardize_val_for_comparison(val):
 
 
 def vals_close(val1, val2):
+    if val1 is val2:
+        return True
+    val_type = type(val1)
+    if val_type is type(val2) and (val_type is str or val_type is int or val_type is bool or val_type is bytes):
+        return val1 == val2
     val1 = _standardize_val_for_comparison(val1)
     val2 = _standardize_val_for_comparison(val2)
     if isinstance(val1, float) or isinstance(val2, float):
@@ -151,6 +260,26 @@ def vals_close(val1, val2):
     return val1 == val2
 
 
+def float_vecs_close(val1: List[float], val2: List[float]) -> bool:
+    # same result as vals_close for flat lists of floats, but all in C
+    return len(val1) == len(val2) and all(map(math.isclose, val1, val2))
+
+
+def get_comparator(attr: Usd.Attribute) -> Callable[[Any, Any], bool]:
+    """Returns a function that checks whether two (json-ified) values of the given attribute are close
+
+    Picks the cheapest comparison that's valid for the attribute's type, falling back to the generic vals_close
+    """
+    type_name = attr.GetTypeName()
+    if type_name in FLOAT_TYPE_NAMES:
+        return math.isclose
+    elif type_name in FLOAT_VEC_TYPE_NAMES:
+        return float_vecs_close
+    elif type_name in EXACT_TYPE_NAMES:
+        return operator.eq
+    return vals_close
+
+
 def to_int_float(num):
     if isinstance(num, (int, float)):
         return num
@@ -162,8 +291,40 @@ def to_int_float(num):
         return float(num)
 
 
+def _identity(obj):
+    return obj
+
+
+def _seq_to_json_val(obj):
+    return [to_json_val(x) for x in obj]
+
+
+# to_json_val handlers for exact types - a dict lookup is much cheaper than a chain of isinstance checks
+_JSON_VAL_HANDLERS: Dict[type, Callable[[Any], Any]] = {
+    float: _identity,
+    int: _identity,
+    str: _identity,
+    bool: _identity,
+    type(None): _identity,
+    list: _seq_to_json_val,
+    tuple: _seq_to_json_val,
+    Sdf.AssetPath: operator.attrgetter("path"),
+}
+# Gf vectors only ever hold plain ints / floats...
+_JSON_VAL_HANDLERS.update(dict.fromkeys(GF_VEC_TYPES, list))
+# ...and matrices iterate over rows, which are vectors
+_JSON_VAL_HANDLERS.update(dict.fromkeys(GF_MATRIX_TYPES, _seq_to_json_val))
+
+
 def to_json_val(obj):
-    if isinstance(obj, (int, float, str, type(None))):
+    handler = _JSON_VAL_HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    return _to_json_val_slow(obj)
+
+
+def _to_json_val_slow(obj):
+    if isinstance(obj, (int, float, str)):
         return obj
     elif isinstance(obj, Sdf.AssetPath):
         return obj.path
@@ -176,8 +337,10 @@ def to_json_val(obj):
 
 def format_val(val):
     if isinstance(val, float):
-        if math.isclose(val, int(val)):
-            val = int(val)
+        int_val = int(val)
+        # exact equality is the common case, and much cheaper than isclose
+        if val == int_val or math.isclose(val, int_val):
+            val = int_val
         else:
             return f"{val:.1f}".lstrip("0")
     elif isinstance(val, str):
@@ -192,6 +355,14 @@ def format_val(val):
     elif isinstance(val, (list, tuple)) and len(val) == 3:
         # we assume color for now
         val = tuple(val)
+        # most colors are exactly one of the named ones, so try a dict lookup before the isclose scan
+        try:
+            name = COLOR_NAMES.get(val)
+        except TypeError:
+            # unhashable elements
+            name = None
+        if name is not None:
+            return name
         for color3, name in COLOR_NAMES.items():
             if all(math.isclose(a, b, rel_tol=1e-7) for (a, b) in zip(color3, val)):
                 return name
@@ -227,6 +398,16 @@ def get_light_name(light):
 
 
 def get_fallback(attr: Usd.Attribute):
+    prim = attr.GetPrim()
+    key = (prim.GetTypeName(), tuple(prim.GetAppliedSchemas()), attr.GetName())
+    fallback = _FALLBACK_CACHE.get(key, MISSING)
+    if fallback is MISSING:
+        fallback = _get_fallback_uncached(attr)
+        _FALLBACK_CACHE[key] = fallback
+    return fallback
+
+
+def _get_fallback_uncached(attr: Usd.Attribute):
     override = luxtest_const.DEFAULT_OVERRIDES.get(attr.GetName())
     if override is not None:
         return override
@@ -251,20 +432,44 @@ def find_usds(path: str, recurse=False):
         paths = [path]
     elif os.path.isdir(path):
         paths = []
-        for entry in os.scandir(path):
-            if entry.is_file() and entry.name.endswith(USD_EXTENSIONS):
-                paths.append(entry.path)
-            elif entry.is_dir() and recurse:
-                paths.extend(find_usds(entry.path), recurse=recurse)
+        dirs = [path]
+        while dirs:
+            with os.scandir(dirs.pop()) as entries:
+                for entry in entries:
+                    # DirEntry.is_file / is_dir use the file type from the directory listing, so no extra stat
+                    # calls. Like os.walk, don't follow symlinked dirs, to avoid cycles
+                    if entry.name.endswith(USD_EXTENSIONS) and entry.is_file():
+                        paths.append(entry.path)
+                    elif recurse and entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
     else:
         raise ValueError(f"path was not a file or directory: {path}")
     return paths
 
 
+def get_attr_names(attrs: Iterable[Usd.Attribute]) -> List[str]:
+    # names are used as dict keys for every frame, so intern them, so all frames share the same str objects
+    return [sys.intern(attr.GetName()) for attr in attrs]
+
+
+@functools.lru_cache(maxsize=None)
+def get_attrs_tuple(constants: Tuple[str, ...], defaults: Tuple[str, ...], varying: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Sorted tuple of all the given attr names
+
+    Cached, so FrameGroupTrackers over the same attrs (ie, almost all of them for a given light) share the same tuple
+    """
+    return tuple(sorted(itertools.chain(constants, defaults, varying)))
+
+
 def get_override_group(light_name, frame) -> Optional[FrameRange]:
-    for frame_range in SUMMARY_OVERRIDES.get(light_name, {}).keys():
-        if frame_range.has_frame(frame):
-            return frame_range
+    sorted_ranges = SORTED_OVERRIDE_RANGES.get(light_name)
+    if sorted_ranges is None:
+        return None
+    starts, ranges = sorted_ranges
+    # ranges don't overlap, so the only candidate is the last one starting at or before frame
+    i = bisect.bisect_right(starts, frame) - 1
+    if i >= 0 and frame <= ranges[i].end:
+        return ranges[i]
     return None
 
 
@@ -273,7 +478,7 @@ def get_override_group(light_name, frame) -> Optional[FrameRange]:
 ###############################################################################
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FrameGroup:
     """A frame group is a range over which exactly 1 parameter is varying, and in the same direction"""
 
@@ -291,6 +496,10 @@ class FrameGroup:
         data["frames"] = FrameRange(*data["frames"])
         return cls(**data)
 
+    def to_dict(self):
+        # shallow - unlike dataclasses.asdict, doesn't deep-copy the (never modified after creation) value dicts
+        return {"frames": self.frames, "varying": self.varying, "non_default_constants": self.non_default_constants}
+
 
 @dataclasses.dataclass
 class FrameGroupTracker:
@@ -307,53 +516,76 @@ class FrameGroupTracker:
     constants: List[str]  # constant, but not at default
     defaults: List[str]  # constant, AND default
 
-    override_group: Optional[FrameRange] = dataclasses.field(init=False, default=None)
+    # functions used to compare values of each attr, by name - see get_comparator; attrs not present use vals_close
+    comparators: Dict[str, Callable[[Any, Any], bool]] = dataclasses.field(default_factory=dict, repr=False)
+
+    # if not given, looked up from the first frame
+    override_group: Optional[FrameRange] = MISSING
+
+    # cached result of attrs() - combine moves attrs between constants / defaults / varying, but never changes the
+    # overall set, so this never needs updating
+    _attrs: Tuple[str, ...] = dataclasses.field(init=False, default=(), repr=False)
 
     def __post_init__(self):
         # sort the things...
         self.constants = sorted(self.constants)
         self.defaults = sorted(self.defaults)
 
-        attrs = self.attrs()
+        self._attrs = attrs = get_attrs_tuple(tuple(self.constants), tuple(self.defaults), tuple(sorted(self.varying)))
+
+        # fetch all of a frame's vals, in attr order, with a single C-level call
+        if len(attrs) == 1:
+            only_attr = attrs[0]
+
+            def get_vals(vals):
+                return (vals[only_attr],)
+
+        elif attrs:
+            get_vals = operator.itemgetter(*attrs)
+        else:
+
+            def get_vals(vals):
+                return ()
 
         sorted_frame_vals = {}
         for frame in sorted(self.frame_vals):
-            vals = self.frame_vals[frame]
             try:
-                sorted_frame_vals[frame] = {attr: vals[attr] for attr in attrs}
+                sorted_frame_vals[frame] = dict(zip(attrs, get_vals(self.frame_vals[frame])))
             except KeyError as err:
                 print(f"Frame {frame} was missing attr {err.args[0]!r}")
                 raise
         self.frame_vals = sorted_frame_vals
 
-        # just get override group of first frame - we should only create a
-        # FrameGroupTracker for frames in the same override group - validate() will
-        # confirm
-        self.override_group = get_override_group(self.light_name, list(self.frame_vals)[0])
+        if self.override_group is MISSING:
+            # just get override group of first frame - we should only create a
+            # FrameGroupTracker for frames in the same override group - validate() will
+            # confirm
+            self.override_group = get_override_group(self.light_name, next(iter(self.frame_vals)))
+            check_override_groups = True
+        else:
+            # the caller already looked it up for these frames, so only need to check if there's more than one
+            check_override_groups = len(self.frame_vals) > 1
 
         # verify assumptions
-        self.validate()
+        self.validate(check_override_groups=check_override_groups)
 
     def frames(self):
         return tuple(self.frame_vals)
 
-    def attrs(self) -> Tuple[str]:
-        attrs = list(self.constants)
-        attrs.extend(self.defaults)
-        if self.varying:
-            attrs.extend(self.varying)
-        return tuple(sorted(attrs))
-
-    def validate(self):
-        for frame in self.frame_vals:
-            override_group = get_override_group(self.light_name, frame)
-            if override_group != self.override_group:
-                raise RuntimeError(
-                    "Tried to create a FrameGroupTracker with frames from different override groups -"
-                    f" {self.override_group} and {override_group}"
-                )
+    def attrs(self) -> Tuple[str, ...]:
+        return self._attrs
+
+    def validate(self, check_override_groups: bool = True):
+        if check_override_groups:
+            for frame in self.frame_vals:
+                override_group = get_override_group(self.light_name, frame)
+                if override_group != self.override_group:
+                    raise RuntimeError(
+                        "Tried to create a FrameGroupTracker with frames from different override groups -"
+                        f" {self.override_group} and {override_group}"
+                    )
 
-        attrs = self.attrs()
+        attrs = self._attrs
         if len(attrs) != len(set(attrs)):
             dupe = None
             known = set()
@@ -373,45 +605,67 @@ class FrameGroupTracker:
             if self.varying:
                 raise ValueError("had only 1 frame, but had varying attrs")
 
-        if not is_sorted(self.frame_vals):
-            raise ValueError("attrs were not sorted")
+        # no need to check that frame_vals is sorted - it's sorted in __post_init__, and combine only ever appends
+        # greater frames
 
         for frame, vals in self.frame_vals.items():
             if tuple(vals) != attrs:
-                # Something is wrong with attrs on this frame - figure out what,
-                # and print more informative error
-                vals_set = set(vals)
-                attrs_set = set(attrs)
-                if vals_set != attrs_set:
-                    missing = attrs_set - vals_set
-                    if missing:
-                        raise ValueError(f"frame {frame} missing attributes: {', '.join(missing)}")
-                    extra = vals_set - attrs_set
-                    raise ValueError(f"frame {frame} had extra attributes: {', '.join(extra)}")
-                # same set, so must just be out of order
-                if not is_sorted(vals):
-                    raise ValueError(f"attrs for frame {frame} not sorted: {', '.join(vals)}")
-                elif not is_sorted(attrs):
-                    raise ValueError(f"self.attrs() was not sorted: {', '.join(attrs)}")
-                # hmm... not sure what's wrong?
-                raise ValueError(f"Unknown error with attributes for frame {frame} - wanted {attrs}, got {tuple(vals)}")
+                self._raise_attrs_mismatch(frame, vals)
+
+    def _raise_attrs_mismatch(self, frame: IntFloat, vals: Dict[str, Any]):
+        """Something is wrong with attrs on this frame - figure out what, and raise a more informative error"""
+        attrs = self._attrs
+        vals_set = set(vals)
+        attrs_set = set(attrs)
+        if vals_set != attrs_set:
+            missing = attrs_set - vals_set
+            if missing:
+                raise ValueError(f"frame {frame} missing attributes: {', '.join(missing)}")
+            extra = vals_set - attrs_set
+            raise ValueError(f"frame {frame} had extra attributes: {', '.join(extra)}")
+        # same set, so must just be out of order
+        if not is_sorted(vals):
+            raise ValueError(f"attrs for frame {frame} not sorted: {', '.join(vals)}")
+        elif not is_sorted(attrs):
+            raise ValueError(f"self.attrs() was not sorted: {', '.join(attrs)}")
+        # hmm... not sure what's wrong?
+        raise ValueError(f"Unknown error with attributes for frame {frame} - wanted {attrs}, got {tuple(vals)}")
 
     def find_varying_vals(
-        self, this_frame: IntFloat, other: "FrameGroupTracker", other_frame: IntFloat
+        self,
+        this_frame: IntFloat,
+        other: "FrameGroupTracker",
+        other_frame: IntFloat,
+        max_count: Optional[int] = None,
+        expected: Optional[Dict[str, bool]] = None,
     ) -> Dict[str, bool]:
         """Finds all attributes that differ between this and other FrameGroupTracker
 
         returns mapping from attr name to whether it increased (ie, if False, it decreased)
+
+        If max_count is given, returns as soon as that many differing attrs are found; if expected is given, returns
+        as soon as a differing attr is found that is not in expected (or is, but in the other direction). In either
+        case, the result is then incomplete, and only good for telling that it doesn't match what was wanted.
         """
         this_vals = self.frame_vals[this_frame]
         other_vals = other.frame_vals[other_frame]
         # returns dict from attr name to "increasing" bool
         attr_to_increasing = {}
-        for attr in self.attrs():
+        comparators = self.comparators
+        for attr in self._attrs:
             old = this_vals[attr]
             new = other_vals[attr]
-            if not vals_close(old, new):
-                attr_to_increasing[attr] = new > old
+            # almost all attrs are unchanged between frames, and exact equality is much cheaper than vals_close -
+            # unchanged values are usually even the same object (see FrameGroupFinder.get_frame_vals)
+            if old is new or old == new:
+                continue
+            if not comparators.get(attr, vals_close)(old, new):
+                increasing = new > old
+                attr_to_increasing[attr] = increasing
+                if len(attr_to_increasing) == max_count:
+                    break
+                if expected is not None and expected.get(attr, MISSING) != increasing:
+                    break
         return attr_to_increasing
 
     def combine(self, other: "FrameGroupTracker") -> bool:
@@ -419,29 +673,38 @@ class FrameGroupTracker:
 
         Returns true if the the frame_vals were combined (in which case other can be discarded)
         """
-        attrs = self.attrs()
-        if attrs != other.attrs():
+        # attrs tuples are usually shared (see get_attrs_tuple), so check identity first
+        if self._attrs is not other._attrs and self._attrs != other._attrs:
             raise ValueError("to combine two FrameGroups, must be over same set of attrs")
 
         # below two are just confirming assumptions, so I don't have to think about general case...
         if len(other.frame_vals) != 1:
             raise ValueError("currenly only support adding a frame group of size 1")
-        if max(self.frame_vals) >= min(other.frame_vals):
+        # frame_vals are sorted, so last / first are max / min
+        this_frame = next(reversed(self.frame_vals))
+        other_frame = next(iter(other.frame_vals))
+        if this_frame >= other_frame:
             raise ValueError("currenly only support adding a frame group whose frames are all strictly greater")
         can_combine = False
-        this_frame = self.frames()[-1]
-        other_frame = other.frames()[0]
-
-        new_varying = self.find_varying_vals(this_frame, other, other_frame)
 
         if self.override_group is not None or other.override_group is not None:
             # at least one is an an override group - we can definitely say whether they should be grouped based on that
             can_combine = self.override_group == other.override_group
-        elif not self.varying:
-            if len(new_varying) == 1:
+            if not can_combine:
+                return False
+            # any number of attrs may vary within an override group, so we need all of them
+            new_varying = self.find_varying_vals(this_frame, other, other_frame)
+        else:
+            # we can only combine if exactly 1 attr varies (and it matches self.varying, if we have one) - so stop
+            # looking as soon as we know that's not the case
+            new_varying = self.find_varying_vals(
+                this_frame, other, other_frame, max_count=2, expected=self.varying or None
+            )
+            if not self.varying:
+                if len(new_varying) == 1:
+                    can_combine = True
+            elif len(new_varying) == 1 and new_varying == self.varying:
                 can_combine = True
-        elif len(new_varying) == 1 and new_varying == self.varying:
-            can_combine = True
 
         if can_combine:
             for attr, increasing in new_varying.items():
@@ -463,7 +726,16 @@ class FrameGroupTracker:
 
             # only thing left to do is add in the new frame_vals
             self.frame_vals.update(other.frame_vals)
-            self.validate()
+
+            # other was already validated on creation, and we know its frame is greater + attrs match, so the only
+            # thing left to check is that override groups match
+            if other.override_group != self.override_group:
+                raise RuntimeError(
+                    "Tried to combine FrameGroupTrackers with frames from different override groups -"
+                    f" {self.override_group} and {other.override_group}"
+                )
+            if VALIDATE_ALL:
+                self.validate()
         return can_combine
 
     @classmethod
@@ -473,17 +745,29 @@ class FrameGroupTracker:
         frame: IntFloat,
         vals: Dict[Usd.Attribute, IntFloat],
         default_vals: Optional[Dict[str, Any]] = None,
+        comparators: Optional[Dict[str, Callable[[Any, Any], bool]]] = None,
+        names: Optional[Sequence[str]] = None,
+        override_group: Optional[FrameRange] = MISSING,
     ) -> "FrameGroupTracker":
+        """Create a FrameGroupTracker for a single frame, from a dict from attrs to their values
+
+        If given, names should be the (interned) names of the attrs in vals, in the same order - passing them avoids
+        calling attr.GetName() for every attr on every frame. Similarly, override_group may be given if already known
+        for this frame.
+        """
         # if we only have one frame, there's nothing to vary, so all we can do
         # is check which are at defaults
         if default_vals is None:
             default_vals = {}
+        if names is None:
+            names = get_attr_names(vals)
 
         default_attrs = []
         constant_attrs = []
 
-        for attr, val in vals.items():
-            name = attr.GetName()
+        vals_by_name = {}
+        for name, (attr, val) in zip(names, vals.items()):
+            vals_by_name[name] = val
             default = default_vals.get(name, MISSING)
             if default is MISSING:
                 default = get_fallback(attr)
@@ -492,7 +776,6 @@ class FrameGroupTracker:
                 default_attrs.append(name)
             else:
                 constant_attrs.append(name)
-        vals_by_name = {attr.GetName(): val for attr, val in vals.items()}
         frame_vals = {frame: vals_by_name}
         return cls(
             light_name=light_name,
@@ -500,27 +783,14 @@ class FrameGroupTracker:
             varying={},
             constants=constant_attrs,
             defaults=default_attrs,
+            comparators=comparators if comparators is not None else {},
+            override_group=override_group,
         )
 
-    @classmethod
-    def for_frame_attrs(
-        cls,
-        light_name: str,
-        frame: IntFloat,
-        attrs: Iterable[Usd.Attribute],
-        default_vals: Optional[Dict[str, Any]] = None,
-    ) -> "FrameGroupTracker":
-        all_names = sorted(attr.GetName() for attr in attrs)
-        if len(all_names) != len(set(all_names)):
-            raise ValueError(f"name clash in attrs: {attrs}")
-        vals = {attr: to_json_val(attr.Get(frame)) for attr in attrs}
-        default_vals = {}
-        return cls.for_frame(light_name, frame, vals, default_vals=default_vals)
-
     def to_frame_group(self) -> FrameGroup:
-        frames = self.frames()
-        start = frames[0]
-        end = frames[-1]
+        # frame_vals are sorted, so first / last are start / end
+        start = next(iter(self.frame_vals))
+        end = next(reversed(self.frame_vals))
         if self.varying:
             varying_vals = {}
             for attr in self.varying:
@@ -559,20 +829,80 @@ class FrameGroupFinder:
     all_frames: List[IntFloat]
     frame_groups: List[FrameGroupTracker] = dataclasses.field(default_factory=list)
 
-    def run(self):
-        for frame in self.all_frames:
-            self.run_frame(frame)
+    # fallback values by attr name - shared across all frames
+    default_vals: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    names: List[str] = dataclasses.field(init=False)  # names of all_attrs, in the same order
+    queries: List[Usd.AttributeQuery] = dataclasses.field(init=False)
+    comparators: Dict[str, Callable[[Any, Any], bool]] = dataclasses.field(init=False)
+    override_groups: List[Optional[FrameRange]] = dataclasses.field(init=False)  # for each of all_frames
+
+    # raw / json values of each attr from the last frame fetched by get_frame_vals, in all_attrs order
+    _last_raw: List[Any] = dataclasses.field(init=False, repr=False)
+    _last_json: List[Any] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.names = get_attr_names(self.all_attrs)
+        if len(self.names) != len(set(self.names)):
+            raise ValueError(f"name clash in attrs: {self.all_attrs}")
+        self.queries = [Usd.AttributeQuery(attr) for attr in self.all_attrs]
+        self.comparators = {name: get_comparator(attr) for name, attr in zip(self.names, self.all_attrs)}
+        self.override_groups = [get_override_group(self.light_name, frame) for frame in self.all_frames]
+        self._last_raw = [MISSING] * len(self.all_attrs)
+        self._last_json = [None] * len(self.all_attrs)
+
+    def get_frame_vals(self, frame: IntFloat) -> Dict[Usd.Attribute, Any]:
+        """Get the json-ified values of all attrs at the given frame
+
+        Most attrs are unchanged on most frames, so if an attr's raw value is the same as on the last call, the last
+        json value is reused, rather than converting again
+        """
+        last_raw = self._last_raw
+        last_json = self._last_json
+        _to_json_val = to_json_val
+        vals = {}
+        for i, (attr, query) in enumerate(zip(self.all_attrs, self.queries)):
+            raw = query.Get(frame)
+            if raw != last_raw[i]:
+                last_raw[i] = raw
+                last_json[i] = _to_json_val(raw)
+            vals[attr] = last_json[i]
+        return vals
 
-    def run_frame(self, frame: IntFloat):
-        new_group = FrameGroupTracker.for_frame_attrs(self.light_name, frame, self.all_attrs)
-        if not self.frame_groups:
+    def run(self):
+        # hot loop - builds a FrameGroupTracker for each frame and combines it into the last group if possible, with
+        # everything bound to locals, and the first-frame special case hoisted out
+        light_name = self.light_name
+        default_vals = self.default_vals
+        comparators = self.comparators
+        names = self.names
+        get_vals = self.get_frame_vals
+        build = FrameGroupTracker.for_frame
+        frame_groups = self.frame_groups
+        append = frame_groups.append
+
+        frame_iter = zip(self.all_frames, self.override_groups)
+        if not frame_groups:
             # special case, very first frame
-            self.frame_groups.append(new_group)
-            return
-        last_group = self.frame_groups[-1]
-        combined = last_group.combine(new_group)
-        if not combined:
-            self.frame_groups.append(new_group)
+            first = next(frame_iter, None)
+            if first is None:
+                return
+            first_frame, override_group = first
+            append(
+                build(light_name, first_frame, get_vals(first_frame), default_vals, comparators, names, override_group)
+            )
+        last_group = frame_groups[-1]
+
+        for frame, override_group in frame_iter:
+            new_group = build(light_name, frame, get_vals(frame), default_vals, comparators, names, override_group)
+            if not last_group.combine(new_group):
+                append(new_group)
+                last_group = new_group
+
+        if not VALIDATE_ALL:
+            # combine only does incremental checks, so do one full check of each final group (if VALIDATE_ALL, every
+            # combine already did this)
+            for group in frame_groups:
+                group.validate()
 
     @classmethod
     def find(
@@ -583,7 +913,7 @@ class FrameGroupFinder:
         return [x.to_frame_group() for x in finder.frame_groups]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LightParamDescription:
     usd_path: str
     frame_groups: List[FrameGroup]
@@ -606,6 +936,15 @@ class LightParamDescription:
     def empty(cls):
         return cls("", [], (1, 1), [])
 
+    def to_dict(self):
+        # shallow - frame_groups are left as FrameGroup objects, for the json encoder to convert
+        return {
+            "usd_path": self.usd_path,
+            "frame_groups": self.frame_groups,
+            "frames": self.frames,
+            "attrs": self.attrs,
+        }
+
     @classmethod
     def from_dict(cls, data):
         data = dict(data)
@@ -619,13 +958,20 @@ class LightParamDescription:
 
         light_name = get_light_name(light)
 
-        attrs = light.GetAuthoredAttributes()
-        attrs = [x for x in attrs if not x.GetNamespace().split(":", 1)[0] == "houdini"]
-        attrs = [x for x in attrs if x.GetName() != "extent"]
-        # ValueMightBeTimeVarying doesn't GUARANTEE that results will have
-        # more than 1 time sample - so just use slower GetTimeSamples()
-        attrs = [x for x in attrs if len(x.GetTimeSamples()) > 1]
-        attrs.sort(key=lambda x: x.GetPath())
+        # single pass over the attrs, so we only query each attr's name / sample count once
+        animated = []  # (name, attr) tuples
+        for attr in light.GetAuthoredAttributes():
+            name = sys.intern(attr.GetName())
+            if name == "extent" or name.startswith("houdini:"):
+                continue
+            # ValueMightBeTimeVarying doesn't GUARANTEE that results will have
+            # more than 1 time sample - so count them (GetNumTimeSamples doesn't build a list)
+            if attr.GetNumTimeSamples() > 1:
+                animated.append((name, attr))
+        # all attrs are on the same prim, so sorting by name is the same as sorting by path
+        animated.sort(key=lambda x: x[0])
+        attr_names = [x[0] for x in animated]
+        attrs = [x[1] for x in animated]
 
         all_samples = Usd.Attribute.GetUnionedTimeSamples(attrs)
 
@@ -633,7 +979,7 @@ class LightParamDescription:
         end = -math.inf
 
         if all_samples:
-            all_samples.sort()
+            # all_samples is already sorted
             # we render at fixed frames, no at samples - so get first / last, then iterate over range
             start = math.floor(all_samples[0])
             end = int(all_samples[-1])
@@ -651,7 +997,6 @@ class LightParamDescription:
 
         frames_list = list(frame_range.iter_frames())
         frame_groups = FrameGroupFinder.find(light_name, all_attrs=attrs, all_frames=frames_list)
-        attr_names = [x.GetName() for x in attrs]
 
         # xformOps are commonly set to non-default, and uninteresting for us - only
         # include them if they're varying
@@ -665,42 +1010,209 @@ class LightParamDescription:
 
 class DataclassJsonEncoder(json.JSONEncoder):
     def default(self, o):
+        to_dict = getattr(o, "to_dict", None)
+        if to_dict is not None:
+            return to_dict()
         if dataclasses.is_dataclass(o):
             return dataclasses.asdict(o)
         # Let the base class default method raise the TypeError
         return super().default(o)
 
 
+JSON_INDENT = 4
+
+
+def dumps_json(obj) -> bytes:
+    # always uses the stdlib, so the written json doesn't depend on whether orjson is installed (orjson only supports
+    # indenting by 2, doesn't sort dataclass fields, and formats floats differently) - it's only used for the cache
+    return json.dumps(obj, sort_keys=True, indent=JSON_INDENT, cls=DataclassJsonEncoder).encode("utf8")
+
+
+if orjson is not None:
+
+    def loads_json(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN / Infinity that the stdlib writes for non-finite floats
+            return json.loads(data)
+
+else:
+    loads_json = json.loads
+
+
+JSON_WRITE_BUFFER_SIZE = 1 << 18  # 256 KiB
+
+
+def write_json_descriptions(descriptions: Dict[str, "LightParamDescription"], json_out_path: str):
+    """Write out descriptions as a json dict, sorted by light name
+
+    Each light is serialized and written separately, so we never need to hold the entire serialized output in memory
+    """
+    if not descriptions:
+        with open(json_out_path, "wb") as writer:
+            writer.write(b"{}")
+        return
+
+    indent = b" " * JSON_INDENT
+    # we do several small writes per light, so use a large buffer
+    with open(json_out_path, "wb", buffering=JSON_WRITE_BUFFER_SIZE) as writer:
+        writer.write(b"{\n")
+        for i, light_name in enumerate(sorted(descriptions)):
+            if i:
+                writer.write(b",\n")
+            light_json = dumps_json(descriptions[light_name])
+            # json strings can't contain a literal newline, so this is safe
+            light_json = light_json.replace(b"\n", b"\n" + indent)
+            writer.write(indent + dumps_json(light_name) + b": " + light_json)
+        writer.write(b"\n}")
+
+
 ###############################################################################
 # Core functions
 ###############################################################################
 
 
-def write_light_param_descriptions(path: str, recurse: bool = False, json_out_path=OUTPUT_JSON_PATH, errors="raise"):
+def get_cache_path(json_out_path: str) -> str:
+    return os.path.splitext(json_out_path)[0] + CACHE_SUFFIX
+
+
+def get_layer_stats(layer_paths: Iterable[str]) -> Optional[Dict[str, List[int]]]:
+    """Return {path: [mtime_ns, size]} for the given layer paths, or None if any could not be stat'ed"""
+    stats = {}
+    for layer_path in layer_paths:
+        try:
+            stat = os.stat(layer_path)
+        except OSError:
+            return None
+        stats[layer_path] = [stat.st_mtime_ns, stat.st_size]
+    return stats
+
+
+def read_cache(cache_path: str) -> Dict[str, Any]:
+    """Read the per-usd-file cache, returning an empty one if missing, unreadable, or stale
+
+    It's stale if it's from another SCHEMA_VERSION, or was written by a different version of the generating code
+    """
+    try:
+        with open(cache_path, "rb") as reader:
+            data = reader.read()
+        cache = loads_json(data)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != SCHEMA_VERSION:
+        return {}
+    source_stats = get_layer_stats(CACHE_SOURCE_PATHS)
+    if source_stats is None or cache.get("sources") != source_stats:
+        return {}
+    return cache.get("files", {})
+
+
+def write_cache(cache_path: str, files: Dict[str, Any]):
+    cache = {"version": SCHEMA_VERSION, "sources": get_layer_stats(CACHE_SOURCE_PATHS), "files": files}
+    # use the stdlib, not orjson - orjson would write non-finite floats as null, so a cached run could give different
+    # results than an uncached one
+    data = json.dumps(cache, cls=DataclassJsonEncoder).encode("utf8")
+    with open(cache_path, "wb") as writer:
+        writer.write(data)
+
+
+def get_cached_descriptions(cache_entry: Optional[Dict[str, Any]]) -> Optional[Dict[str, "LightParamDescription"]]:
+    """Return the cached descriptions for a usd file, if none of the layers it used have changed"""
+    if not cache_entry:
+        return None
+    layers = cache_entry["layers"]
+    if get_layer_stats(layers) != layers:
+        return None
+    return {name: LightParamDescription.from_dict(data) for name, data in cache_entry["descriptions"].items()}
+
+
+def process_usd(usd_path: str, errors="raise"):
+    """Generate the light descriptions for a single usd file
+
+    Returns the descriptions, and the stats of every layer the stage used (see get_layer_stats). Runs in a worker
+    process when processing files in parallel, so everything passed in and out must be picklable.
+    """
+    stage = Usd.Stage.Open(usd_path)
+    descriptions = gen_light_param_descriptions(stage, errors=errors)
+    layer_stats = get_layer_stats(x.realPath for x in stage.GetUsedLayers() if x.realPath)
+    return descriptions, layer_stats
+
+
+def normalize_num_procs(num_procs: int):
+    if num_procs <= 0:
+        num_procs += os.cpu_count() or 1
+    return max(num_procs, 1)
+
+
+def write_light_param_descriptions(
+    path: str,
+    recurse: bool = False,
+    json_out_path=OUTPUT_JSON_PATH,
+    errors="raise",
+    use_cache=True,
+    num_procs=0,
+):
     usd_paths = find_usds(path, recurse=recurse)
     if not usd_paths:
         raise ValueError(f"Could not find any USD files at path: {path}")
-    descriptions = {}
     output_dir = os.path.dirname(os.path.abspath(json_out_path))
+    cache_path = get_cache_path(json_out_path)
+    old_cache = read_cache(cache_path) if use_cache else {}
+    new_cache = {}
+    descriptions_by_path = {}
+    to_process = []
     for usd_path in usd_paths:
-        stage = Usd.Stage.Open(usd_path)
-        print(f"Processing: {usd_path}")
-        descriptions.update(gen_light_param_descriptions(stage, errors=errors))
+        cache_key = os.path.abspath(usd_path)
+        cache_entry = old_cache.get(cache_key)
+        file_descriptions = get_cached_descriptions(cache_entry)
+        if file_descriptions is not None:
+            print(f"Using cached: {usd_path}")
+            new_cache[cache_key] = cache_entry
+            descriptions_by_path[usd_path] = file_descriptions
+        else:
+            print(f"Processing: {usd_path}")
+            to_process.append(usd_path)
+
+    # each usd file is independent, so process them in parallel, in separate processes (most of the work holds the
+    # GIL). Not worth starting up worker processes for a single file, though
+    num_procs = min(normalize_num_procs(num_procs), len(to_process))
+    process = functools.partial(process_usd, errors=errors)
+    if num_procs > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=num_procs) as executor:
+            results = list(executor.map(process, to_process))
+    else:
+        results = [process(x) for x in to_process]
+
+    for usd_path, (file_descriptions, layer_stats) in zip(to_process, results):
+        descriptions_by_path[usd_path] = file_descriptions
+        # key on every layer the stage used, so edits to sublayers / references also invalidate. Only cache when
+        # errors are raised - with "warn", results may be silently incomplete
+        if errors == "raise" and layer_stats is not None:
+            # take a snapshot now, before make_usd_path_relative modifies the descriptions
+            new_cache[os.path.abspath(usd_path)] = {
+                "layers": layer_stats,
+                "descriptions": {name: desc.to_dict() for name, desc in file_descriptions.items()},
+            }
+
+    descriptions = {}
+    for usd_path in usd_paths:
+        descriptions.update(descriptions_by_path[usd_path])
+    if use_cache:
+        write_cache(cache_path, new_cache)
 
     # Prep for serializing but making paths relative + linux
     for description in descriptions.values():
         description.make_usd_path_relative(output_dir)
 
-    print(f"Got {len(descriptions)} descriptions")
-    print("=" * 80)
+    # build up the full summary and write it out at once, rather than many small prints
+    lines = [f"Got {len(descriptions)} descriptions", "=" * 80]
     for light_name, desc in descriptions.items():
-        print()
-        print(f"{light_name}:")
-        print(summarize_light(light_name, desc))
-    print("=" * 80)
+        lines.extend(("", f"{light_name}:", summarize_light(light_name, desc)))
+    lines.extend(("=" * 80, ""))
+    sys.stdout.write("\n".join(lines))
     print(f"Writing as json: {json_out_path}")
-    with open(json_out_path, "w", encoding="utf8", newline="\n") as writer:
-        json.dump(descriptions, writer, sort_keys=True, indent=4, cls=DataclassJsonEncoder)
+    write_json_descriptions(descriptions, json_out_path)
     return
 
 
@@ -787,9 +1299,30 @@ def gen_light_param_descriptions(stage: Usd.Stage, errors="raise"):
     return all_descs
 
 
+# {abs_path: ((mtime_ns, size), descriptions)} - so, ie, gendiffs' get_parser and gen_diffs only parse the file once
+_read_descriptions_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, LightParamDescription]]] = {}
+
+
 def read_descriptions(path=OUTPUT_JSON_PATH):
-    with open(path, "r", encoding="utf8") as reader:
-        raw_data = json.load(reader)
+    """Read the light descriptions json at path
+
+    Results are cached until the file changes; the returned dict is a new one each call, but the descriptions in it are
+    shared, so should not be modified
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    file_stats = (stat.st_mtime_ns, stat.st_size)
+    cached = _read_descriptions_cache.get(abs_path)
+    if cached is not None and cached[0] == file_stats:
+        return dict(cached[1])
+    descriptions = _read_descriptions(abs_path)
+    _read_descriptions_cache[abs_path] = (file_stats, descriptions)
+    return dict(descriptions)
+
+
+def _read_descriptions(path):
+    with open(path, "rb") as reader:
+        raw_data = loads_json(reader.read())
 
     output_dir = os.path.dirname(os.path.abspath(path))
     descriptions = {}
@@ -836,6 +1369,25 @@ def get_parser():
             "lights or usda files"
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--num-procs",
+        type=int,
+        default=0,
+        help=(
+            "Number of processes to use to process usd files in parallel; 0 means use os.cpu_count(); negative values"
+            " are subtracted from os.cpu_count()"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help=(
+            "Reprocess all usd files, ignoring (and not updating) the cache of results from unchanged usd files, "
+            f"which is stored next to the output json, with the suffix {CACHE_SUFFIX}"
+        ),
+    )
     return parser
 
 
@@ -845,7 +1397,9 @@ def main(argv=None):
     parser = get_parser()
     args = parser.parse_args()
     try:
-        write_light_param_descriptions(args.path, recurse=args.recurse, errors=args.errors)
+        write_light_param_descriptions(
+            args.path, recurse=args.recurse, errors=args.errors, use_cache=args.use_cache, num_procs=args.num_procs
+        )
     except Exception:  # pylint: disable=broad-except
 
         traceback.print_exc()
@@ -11,7 +11,10 @@ karma, and RenderMan RIS)
 import argparse
 import asyncio
 import datetime
+import functools
+import hashlib
 import inspect
+import json
 import multiprocessing
 import os
 import shutil
@@ -20,7 +23,7 @@ import sys
 import textwrap
 import traceback
 
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 ###############################################################################
 # Constants
@@ -40,7 +43,7 @@ import pip_import
 from luxtest_utils import FrameRange, get_image_path, get_image_url
 
 pip_import.pip_import("tqdm")
-import tqdm.asyncio
+import tqdm
 
 OUTPUT_DIR = "diff"
 
@@ -72,12 +75,39 @@ HTML_END = """<!DOCTYPE html>
   </body>
 """
 
+# per-light templates - dedented once here, and filled in with str.format in _write_html
+HTML_LIGHT_HEADER = textwrap.dedent(
+    """<h1 id="{name}">{name}</h1>
+
+            <table>
+            <tr>
+                <td>Frame</td>
+                <td>Ref</td>
+            """
+) + "{renderer_cells}\n</tr>"
+
+HTML_RENDERER_HEADER = textwrap.dedent(
+    """
+                <td>{renderer}</td>
+                <td>{renderer} diff</td>
+            """
+)
+
 OIIOTOOL = os.environ.get("LUXTEST_OIIOTOOL", "oiiotool")
 
 NUM_CPUS = multiprocessing.cpu_count()
 
 SKIP_LIGHTS = ("ies_scale",)
 
+# windows' CreateProcess caps the command line at 32767 chars; elsewhere, the limit is much higher
+MAX_CMD_CHARS = 32000 if sys.platform == "win32" else 200000
+
+# the updates are split into this many oiiotool invocations per worker, so that they're more evenly spread among them
+SHARDS_PER_WORKER = 4
+
+# {png_path: hash of the exr it was made from} - kept out of the web dir, so it isn't published with the pngs
+SRC_HASHES_PATH = os.path.join(THIS_DIR, "png_src_hashes.cache.json")
+
 
 ###############################################################################
 # Utilities
@@ -95,11 +125,36 @@ def is_ipython():
 if sys.platform == "win32":
     to_shell_cmd = subprocess.list2cmdline
 else:
+    import shlex
+
+    to_shell_cmd = shlex.join
+
+
+def hash_file(path):
+    with open(path, "rb") as reader:
+        if hasattr(hashlib, "file_digest"):
+            # python 3.11+
+            return hashlib.file_digest(reader, "blake2b").hexdigest()
+        hasher = hashlib.blake2b()
+        for chunk in iter(lambda: reader.read(1 << 20), b""):
+            hasher.update(chunk)
+        return hasher.hexdigest()
 
-    def to_shell_cmd(cmd_list):
-        import shlex
 
-        return " ".join(shlex.quote(x) for x in cmd_list)
+def read_src_hashes() -> Dict[str, str]:
+    try:
+        with open(SRC_HASHES_PATH, "r", encoding="utf8") as reader:
+            src_hashes = json.load(reader)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(src_hashes, dict):
+        return {}
+    return src_hashes
+
+
+def write_src_hashes(src_hashes: Dict[str, str]):
+    with open(SRC_HASHES_PATH, "w", encoding="utf8", newline="\n") as writer:
+        json.dump(src_hashes, writer, sort_keys=True)
 
 
 def normalize_concurrency(concurrency: int):
@@ -108,15 +163,58 @@ def normalize_concurrency(concurrency: int):
     return max(concurrency, 1)
 
 
-def needs_update(existing, dependent):
-    if os.path.exists(dependent):
-        return os.path.getmtime(existing) > os.path.getmtime(dependent)
-    return True
+def read_dir_mtimes(dir_path: str) -> Dict[str, float]:
+    """Returns a map from file name to mtime for everything in dir_path, using a single os.scandir"""
+    try:
+        entries = os.scandir(dir_path)
+    except FileNotFoundError:
+        return {}
+    mtimes = {}
+    with entries:
+        for entry in entries:
+            try:
+                # follow symlinks, to match os.path.getmtime (the fallback in get_mtime) - a linked exr is only
+                # up to date if its target is
+                mtimes[entry.name] = entry.stat().st_mtime
+            except OSError:
+                # ie, a dangling symlink, or deleted since the scandir - just treat it as missing
+                continue
+    return mtimes
+
+
+def get_mtime(path: str, dir_mtimes: Optional[Dict[str, Dict[str, float]]] = None) -> Optional[float]:
+    """Returns the mtime of path, or None if it doesn't exist
+
+    If given, dir_mtimes is used as a cache of read_dir_mtimes results, by dir - so each dir is only read once
+    """
+    if dir_mtimes is None:
+        try:
+            return os.path.getmtime(path)
+        except FileNotFoundError:
+            return None
+    dir_path, name = os.path.split(path)
+    mtimes = dir_mtimes.get(dir_path)
+    if mtimes is None:
+        mtimes = dir_mtimes[dir_path] = read_dir_mtimes(dir_path)
+    return mtimes.get(name)
+
+
+def needs_update(existing, dependent, dir_mtimes: Optional[Dict[str, Dict[str, float]]] = None):
+    dependent_mtime = get_mtime(dependent, dir_mtimes)
+    if dependent_mtime is None:
+        return True
+    existing_mtime = get_mtime(existing, dir_mtimes)
+    if existing_mtime is None:
+        raise FileNotFoundError(f"No such file: {existing!r}")
+    return existing_mtime > dependent_mtime
 
 
 def print_streams(proc: subprocess.CompletedProcess):
     for stream_name in ("stdout", "stderr"):
         stream = getattr(proc, stream_name, None)
+        if stream is None:
+            # wasn't captured
+            continue
         print("=" * 80)
         print(f"{stream_name}:")
         print()
@@ -139,7 +237,10 @@ def raise_proc_error(proc: subprocess.CompletedProcess, verbose: bool):
 async def run(args: Iterable[str], check=False, verbose=False):
     if verbose:
         print(f"Running: {to_shell_cmd(args)}")
-    proc = await asyncio.create_subprocess_exec(args[0], *args[1:], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # stdout is only ever printed if verbose (and can be large - ie, --diff reports), so otherwise just discard it.
+    # stderr is always kept, so we can report errors
+    stdout_dest = subprocess.PIPE if verbose else subprocess.DEVNULL
+    proc = await asyncio.create_subprocess_exec(args[0], *args[1:], stdout=stdout_dest, stderr=subprocess.PIPE)
     stdout, stderr = await proc.communicate()
     completed_proc = subprocess.CompletedProcess(args=args, returncode=proc.returncode, stdout=stdout, stderr=stderr)
     if verbose:
@@ -158,34 +259,32 @@ async def run(args: Iterable[str], check=False, verbose=False):
 ###############################################################################
 
 
-async def update_png(exr_path, png_path, verbose=False):
-
-    if needs_update(exr_path, png_path):
-        if verbose:
-            print(f"Creating png: {png_path}")
-        cmd = [
-            OIIOTOOL,
-            exr_path,
-            "--ch",
-            "R,G,B",
-            "--colorconvert",
-            "linear",
-            "sRGB",
-            "-o",
-            png_path,
-        ]
-        proc = await run(cmd, verbose=verbose, check=True)
-        if not os.path.isfile:
-            print(f"Error - output png did not exist: {png_path}")
-            raise_proc_error(proc, verbose)
+# oiiotool is stack based, and -o doesn't pop the image it writes - so we can generate many images with a single
+# invocation, by appending the args for each, and popping each result once it's written. Channels are selected on
+# input (-i:ch=), so any others are never decompressed / converted; and they're read as half (-i:type=half) rather
+# than upconverted to float, since the output is only 8-bit
+def get_png_args(exr_path, png_path):
+    return [
+        "-i:ch=R,G,B:type=half",
+        exr_path,
+        "--colorconvert",
+        "linear",
+        "sRGB",
+        "-o",
+        png_path,
+        "--pop",
+    ]
 
 
-async def update_diff(exr_path1, exr_path2, diff_path, verbose=False):
-    cmd = [
-        OIIOTOOL,
+def get_diff_args(exr_path1, exr_path2, diff_path, report=False):
+    # --diff just prints a report comparing the two images (and leaves them on the stack)
+    report_args = ["--diff"] if report else []
+    return [
+        "-i:ch=R,G,B,A:type=half",
         exr_path1,
+        "-i:ch=R,G,B,A:type=half",
         exr_path2,
-        "--diff",
+        *report_args,
         "--absdiff",
         "--mulc",
         "2,2,2,1",
@@ -196,11 +295,97 @@ async def update_diff(exr_path1, exr_path2, diff_path, verbose=False):
         "sRGB",
         "-o",
         diff_path,
+        "--pop",
     ]
-    proc = await run(cmd, verbose=verbose)
-    if not os.path.isfile:
-        print(f"Error - output diff png did not exist: {diff_path}")
+
+
+def get_oiiotool_cmd(threads: int = 0):
+    """The start of an oiiotool command line; threads is the size of its thread pool, with 0 meaning all cores"""
+    cmd = [OIIOTOOL]
+    if threads > 0:
+        cmd.extend(["--threads", str(threads)])
+    return cmd
+
+
+async def update_pngs(
+    exr_png_paths: List[Tuple[str, str]],
+    verbose=False,
+    threads: int = 0,
+    src_hashes: Optional[Dict[str, str]] = None,
+):
+    """Convert each of the (exr_path, png_path) pairs to png, with a single oiiotool invocation
+
+    If given, src_hashes maps png paths to the hash of the exr they were made from; pngs whose exr contents are
+    unchanged since they were last converted (ie, the exr was just touched, or re-rendered identically) are skipped,
+    and src_hashes is updated for the ones that are converted
+    """
+    if src_hashes is None:
+        new_hashes = [None] * len(exr_png_paths)
+    else:
+        # hashing releases the GIL, so do the exrs in threads
+        new_hashes = await asyncio.gather(*(asyncio.to_thread(hash_file, exr_path) for exr_path, _ in exr_png_paths))
+
+    cmd = get_oiiotool_cmd(threads)
+    to_update = []
+    for (exr_path, png_path), src_hash in zip(exr_png_paths, new_hashes):
+        if src_hash is not None and src_hash == src_hashes.get(png_path) and os.path.isfile(png_path):
+            if verbose:
+                print(f"Source exr unchanged, skipping png: {png_path}")
+            # bump the mtime, so needs_update won't flag it again
+            os.utime(png_path)
+            continue
+        if verbose:
+            print(f"Creating png: {png_path}")
+        cmd.extend(get_png_args(exr_path, png_path))
+        to_update.append((png_path, src_hash))
+    if not to_update:
+        return
+
+    proc = await run(cmd, verbose=verbose, check=True)
+    for png_path, src_hash in to_update:
+        if not os.path.isfile(png_path):
+            print(f"Error - output png did not exist: {png_path}")
+            raise_proc_error(proc, verbose)
+        if src_hash is not None:
+            src_hashes[png_path] = src_hash
+
+
+async def update_diffs(diff_paths: List[Tuple[str, str, str]], verbose=False, threads: int = 0):
+    """Create each of the (exr_path1, exr_path2, diff_path) diff pngs, with a single oiiotool invocation
+
+    The --diff report is only generated if verbose (it's only printed then) - and since it makes oiiotool return a
+    failing exitcode if the images differ, in that case we can only check stderr for errors
+    """
+    cmd = get_oiiotool_cmd(threads)
+    for exr_path1, exr_path2, diff_path in diff_paths:
+        cmd.extend(get_diff_args(exr_path1, exr_path2, diff_path, report=verbose))
+    proc = await run(cmd, verbose=verbose, check=not verbose)
+    if proc.returncode and b"ERROR" in (proc.stderr or b""):
         raise_proc_error(proc, verbose)
+    for _, _, diff_path in diff_paths:
+        if not os.path.isfile(diff_path):
+            print(f"Error - output diff png did not exist: {diff_path}")
+            raise_proc_error(proc, verbose)
+
+
+def shard_updates(updates: List[Tuple[str, ...]], get_args, num_shards: int) -> List[List[Tuple[str, ...]]]:
+    """Split updates into about num_shards contiguous lists, each one's oiiotool command line under MAX_CMD_CHARS"""
+    if not updates:
+        return []
+    lengths = [sum(len(arg) + 1 for arg in get_args(*update)) for update in updates]
+    target_len = min(-(-sum(lengths) // num_shards), MAX_CMD_CHARS)
+    shards = []
+    shard = []
+    shard_len = 0
+    for update, length in zip(updates, lengths):
+        if shard and shard_len + length > target_len:
+            shards.append(shard)
+            shard = []
+            shard_len = 0
+        shard.append(update)
+        shard_len += length
+    shards.append(shard)
+    return shards
 
 
 async def gen_images_async(
@@ -213,14 +398,16 @@ async def gen_images_async(
     renderers: Iterable[str] = luxtest_const.RENDERERS,
     frame_range: Optional[FrameRange] = None,
 ):
-    all_tasks = []
+    # (update_func, updates) items, consumed by the worker pool below
+    task_queue = asyncio.Queue()
     num_possible_images = 0
 
     renderers = list(renderers)
     if lights is not None:
         lights = list(lights)
 
-    flat_frames = []
+    # (name, frames) for each light - the frames are a range, so we don't build a tuple for every frame
+    light_frames = []
     for name, description in light_descriptions.items():
         if lights is not None and name not in lights:
             continue
@@ -228,55 +415,112 @@ async def gen_images_async(
             light_frame_range = frame_range
         else:
             light_frame_range = description.frames
-        for frame in light_frame_range.iter_frames():
-            flat_frames.append((name, description, frame))
+        frames = light_frame_range.iter_frames()
+        if frames:
+            light_frames.append((name, frames))
+
+    # rather than one oiiotool invocation per image, we gather all the updates, then shard them among a few
+    # invocations per worker (one set for pngs, one for diffs), to save on process startup costs
+    png_updates = []
+    diff_updates = []
+
+    # read the mtimes of everything in each dir once, rather than statting each file (several times)
+    dir_mtimes = {}
+    if light_frames:
+        # the images all live in a few dirs (one per renderer, plus the web img dir) - read them in threads, so the
+        # stat latency overlaps on slow / network filesystems
+        name, frames = light_frames[0]
+        frame = frames[0]
+        dir_paths = sorted(
+            {
+                os.path.dirname(get_image_path(name, renderer, frame, ext, renders_root=renders_root))
+                for renderer in renderers
+                for ext in ("exr", "png")
+            }
+        )
+        all_mtimes = await asyncio.gather(*(asyncio.to_thread(read_dir_mtimes, dir_path) for dir_path in dir_paths))
+        dir_mtimes.update(zip(dir_paths, all_mtimes))
 
     def queue_png_update(exr_path, png_path):
         nonlocal num_possible_images
         num_possible_images += 1
-        if needs_update(exr_path, png_path):
-            all_tasks.append(update_png(exr_path, png_path, verbose=verbose))
+        if needs_update(exr_path, png_path, dir_mtimes):
+            png_updates.append((exr_path, png_path))
 
     def queue_diff_update(exr_path1, exr_path2, diff_path):
         nonlocal num_possible_images
         num_possible_images += 1
-        if needs_update(exr_path1, diff_path) or needs_update(exr_path2, diff_path):
-            all_tasks.append(update_diff(exr_path1, exr_path2, diff_path, verbose=verbose))
+        if needs_update(exr_path1, diff_path, dir_mtimes) or needs_update(exr_path2, diff_path, dir_mtimes):
+            diff_updates.append((exr_path1, exr_path2, diff_path))
 
-    print("Finding how many images need to be updated:")
-    progress = tqdm.tqdm(flat_frames)
-    for name, description, frame in progress:
-        progress.set_postfix({"name": name, "frame": frame})
-
-        if do_diffs:
-            embree_exr_path = get_image_path(name, "embree", frame, "exr", renders_root=renders_root)
-
-        for renderer in renderers:
-            renderer_exr_path = get_image_path(name, renderer, frame, "exr", renders_root=renders_root)
-            renderer_png_path = get_image_path(name, renderer, frame, "png", renders_root=renders_root)
-            queue_png_update(renderer_exr_path, renderer_png_path)
-
-            # don't need to do a diff of embree with itself!
-            if renderer == "embree":
-                continue
+    # (renderer, whether to diff it against embree) - don't need to do a diff of embree with itself!
+    renderer_diffs = [(renderer, do_diffs and renderer != "embree") for renderer in renderers]
 
+    print("Finding how many images need to be updated:")
+    # setting the postfix forces a redraw, so only do it when we move on to a new light (and cap the redraw rate)
+    progress = tqdm.tqdm(total=sum(len(frames) for _, frames in light_frames), mininterval=0.5)
+    for name, frames in light_frames:
+        progress.set_postfix({"name": name}, refresh=False)
+        for frame in frames:
             if do_diffs:
-                diff_png_path = get_image_path(name, renderer, frame, "png", prefix="diff-", renders_root=renders_root)
-                queue_diff_update(embree_exr_path, renderer_exr_path, diff_png_path)
+                embree_exr_path = get_image_path(name, "embree", frame, "exr", renders_root=renders_root)
+
+            for renderer, do_diff in renderer_diffs:
+                renderer_exr_path = get_image_path(name, renderer, frame, "exr", renders_root=renders_root)
+                renderer_png_path = get_image_path(name, renderer, frame, "png", renders_root=renders_root)
+                queue_png_update(renderer_exr_path, renderer_png_path)
 
-    print(f"Generating {len(all_tasks)} images (out of possible {num_possible_images}):")
+                if do_diff:
+                    diff_png_path = get_image_path(
+                        name, renderer, frame, "png", prefix="diff-", renders_root=renders_root
+                    )
+                    queue_diff_update(embree_exr_path, renderer_exr_path, diff_png_path)
+            progress.update()
+    progress.close()
 
     # dont' want to overwhelm system by launching too many subprocess
     max_concurrency = normalize_concurrency(max_concurrency)
-    proc_limiter = asyncio.Semaphore(max_concurrency)
 
-    async def proc_limited_coroutine(coroutine):
-        async with proc_limiter:
-            return await coroutine
+    # read the exr hashes once up front, and write them once at the end
+    src_hashes = read_src_hashes() if png_updates else None
+    update_pngs_func = functools.partial(update_pngs, src_hashes=src_hashes)
+
+    num_shards = max_concurrency * SHARDS_PER_WORKER
+    for updates in shard_updates(png_updates, get_png_args, num_shards):
+        task_queue.put_nowait((update_pngs_func, updates))
+    for updates in shard_updates(diff_updates, functools.partial(get_diff_args, report=verbose), num_shards):
+        task_queue.put_nowait((update_diffs, updates))
+    num_images = len(png_updates) + len(diff_updates)
+
+    # these are upper bounds - pngs whose source exr is unchanged are skipped once hashed, in update_pngs
+    print(
+        f"Found {num_images} candidate images to update (out of possible {num_possible_images}), with up to"
+        f" {task_queue.qsize()} oiiotool invocations:"
+    )
 
-    limited_tasks = [proc_limited_coroutine(x) for x in all_tasks]
+    # only max_concurrency workers exist at once, each pulling (update_func, updates) items off the queue, rather
+    # than creating a coroutine for every task up front
+    num_workers = min(max_concurrency, task_queue.qsize())
+    # ...and each oiiotool proc would otherwise start a thread for every core - so split the cores between the procs
+    # that will actually run, so they don't contend with each other
+    threads = max(NUM_CPUS // max(num_workers, 1), 1)
+    progress = tqdm.tqdm(total=num_images, unit="img")
+
+    async def worker():
+        while True:
+            try:
+                update_func, updates = task_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await update_func(updates, verbose=verbose, threads=threads)
+            progress.update(len(updates))
 
-    await tqdm.asyncio.tqdm_asyncio.gather(*limited_tasks)
+    try:
+        await asyncio.gather(*(worker() for _ in range(num_workers)))
+    finally:
+        progress.close()
+        if src_hashes is not None:
+            write_src_hashes(src_hashes)
 
 
 def gen_images(light_descriptions, verbose=False, max_concurrency=-1, renders_root=""):
@@ -286,7 +530,19 @@ def gen_images(light_descriptions, verbose=False, max_concurrency=-1, renders_ro
 
 
 def gen_html(light_descriptions: Dict[str, genLightParamDescriptions.LightParamDescription], renders_root=""):
-    html = HTML_START
+    html_path = os.path.join(luxtest_const.WEB_ROOT, "luxtest.html")
+    # stream each part straight to the file, rather than building up the whole page in memory
+    with open(html_path, "w", encoding="utf8", newline="\n") as f:
+        _write_html(f, light_descriptions, renders_root)
+
+    css_path = os.path.join(luxtest_const.WEB_ROOT, "luxtest.css")
+    if needs_update("luxtest.css", css_path):
+        shutil.copyfile("luxtest.css", css_path)
+
+
+def _write_html(f, light_descriptions: Dict[str, genLightParamDescriptions.LightParamDescription], renders_root=""):
+    write = f.write
+    write(HTML_START)
     num_cols = len(luxtest_const.THIRD_PARTY_RENDERERS) * 2 + 1
 
     # sort first by number of frames (so tests with, ie, only one frame appear at top and are easy to find), then
@@ -299,64 +555,41 @@ def gen_html(light_descriptions: Dict[str, genLightParamDescriptions.LightParamD
 
     for name, description in sorted_lights:
         # add navbar links first
-        html += f"""<p><a href="#{name}">{name}</a></p>"""
+        write(f"""<p><a href="#{name}">{name}</a></p>""")
 
-    html += HTML_NAVBAR_END
+    write(HTML_NAVBAR_END)
+
+    # the renderer columns of the table header are the same for every light
+    renderer_cells = "".join(
+        HTML_RENDERER_HEADER.format(renderer=renderer) for renderer in luxtest_const.THIRD_PARTY_RENDERERS
+    )
 
     for name, description in sorted_lights:
         # now add main body
         summaries_by_start_frame = genLightParamDescriptions.get_light_group_summaries(name, description)
 
-        html += textwrap.dedent(
-            f"""<h1 id="{name}">{name}</h1>
-
-            <table>
-            <tr>
-                <td>Frame</td>
-                <td>Ref</td>
-            """
-        )
-        for renderer in luxtest_const.THIRD_PARTY_RENDERERS:
-            html += textwrap.dedent(
-                f"""
-                    <td>{renderer}</td>
-                    <td>{renderer} diff</td>
-                """
-            )
-
-        html += "\n</tr>"
+        write(HTML_LIGHT_HEADER.format(name=name, renderer_cells=renderer_cells))
         for frame in description.frames.iter_frames():
 
             if frame in summaries_by_start_frame:
                 desc = summaries_by_start_frame[frame]
-                html += "  <tr></tr>\n"
-                html += "  <tr>\n"
-                html += f"    <td></td><td colspan='{num_cols}'><em>{desc}</em></td>\n"
-                html += "  </tr>\n"
-
-            html += "  <tr>\n"
-            html += f"    <td>{frame:04}</td>"
+                write(f"  <tr></tr>\n  <tr>\n    <td></td><td colspan='{num_cols}'><em>{desc}</em></td>\n  </tr>\n")
 
+            # build up each row, and write it in one go
             embree_url = get_image_url(name, "embree", frame, "png", renders_root=renders_root)
-
-            html += f'    <td><img src="{embree_url}"</td>\n'
+            row = [f'  <tr>\n    <td>{frame:04}</td>    <td><img src="{embree_url}"</td>\n']
 
             for renderer in luxtest_const.THIRD_PARTY_RENDERERS:
                 renderer_url = get_image_url(name, renderer, frame, "png", renders_root=renders_root)
                 diff_url = get_image_url(name, renderer, frame, "png", prefix="diff-", renders_root=renders_root)
 
-                html += f'    <td><img src="{renderer_url}"</td>\n'
-                html += f'    <td><img src="{diff_url}"</td>\n'
-
-            html += "  </tr>"
-
-        html += "</table>\n"
-    html += HTML_END
+                row.append(f'    <td><img src="{renderer_url}"</td>\n    <td><img src="{diff_url}"</td>\n')
 
-    with open(os.path.join(luxtest_const.WEB_ROOT, "luxtest.html"), "w", encoding="utf8", newline="\n") as f:
-        f.write(html)
+            row.append("  </tr>")
+            write("".join(row))
 
-    shutil.copyfile("luxtest.css", os.path.join(luxtest_const.WEB_ROOT, "luxtest.css"))
+        write("</table>\n")
+    write(HTML_END)
 
 
 def gen_diffs(verbose=False, max_concurrency=-1, lights: Iterable[str] = luxtest_const.DEFAULT_LIGHTS):
@@ -1,3 +1,4 @@
+import functools
 import inspect
 import math
 import os
@@ -41,6 +42,18 @@ def top_stage_nodes(type=""):
     return nodes
 
 
+@functools.lru_cache(maxsize=None)
+def encode_name(name: str) -> str:
+    """Memoized hou.text.encode - parm names get encoded repeatedly, and the result never changes"""
+    return hou.text.encode(name)
+
+
+@functools.lru_cache(maxsize=None)
+def decode_name(name: str) -> str:
+    """Memoized hou.text.decode - parm names get decoded repeatedly, and the result never changes"""
+    return hou.text.decode(name)
+
+
 RENDERER_SHORT_NAMES = {
     "BRAY_HdKarma": "karma",
     "HdArnoldRendererPlugin": "arnold",
@@ -72,7 +85,7 @@ class ParmName(NamedTuple):
 
     @property
     def encoded_tuplename(self):
-        return hou.text.encode(self.tuplename)
+        return encode_name(self.tuplename)
 
     @property
     def encoded(self):
@@ -92,7 +105,7 @@ class ParmName(NamedTuple):
             encoded = parm.name()
             assert encoded.startswith(encoded_tuplename)
             suffix = encoded[len(encoded_tuplename) :]
-        return cls(hou.text.decode(encoded_tuplename), suffix)
+        return cls(decode_name(encoded_tuplename), suffix)
 
 
 PN = ParmName
@@ -106,7 +119,7 @@ def pretty_parm_path(parm: hou.Parm):
 def get_parm_tuple(node, name):
     parmTuple = node.parmTuple(name)
     if not parmTuple:
-        parmTuple = node.parmTuple(hou.text.encode(name))
+        parmTuple = node.parmTuple(encode_name(name))
         if not parmTuple:
             # ok, it couldn't be easy - try tuple names...
             raise ValueError(f"node {node.path()!r} has no parmTuple {name!r}")
@@ -137,7 +150,7 @@ def get_parm(node, name, suffix=""):
         if parm:
             return parm
         # last ditch - try encoded?
-        parm = node.parm(hou.text.encode(name))
+        parm = node.parm(encode_name(name))
         if parm:
             return parm
         raise ValueError(f"Could not find a parmTuple for node {node.path()} with name: {name}")
@@ -429,12 +442,12 @@ def get_non_default_parms(nodeOrParms, frames: Optional[Iterable[Union[float, in
 def parmgrep(node, pattern):
     regex = re.compile(pattern, re.IGNORECASE)
     parms = parm_tuple_dict(node)
-    return {name: node for name, node in parms.items() if regex.search(name) or regex.search(hou.text.encode(name))}
+    return {name: node for name, node in parms.items() if regex.search(name) or regex.search(encode_name(name))}
 
 
 def parm_tuple_dict(node, controls=False):
     """Returns a dict from decoded parm tuple name to the parmTuple"""
-    pairs = [(hou.text.decode(p.name()), p) for p in node.parmTuples()]
+    pairs = [(decode_name(p.name()), p) for p in node.parmTuples()]
     if not controls:
         pairs = [(name, node) for name, node in pairs if not name.endswith("_control")]
     pairs.sort(key=lambda pair: pair[0])
@@ -1,3 +1,4 @@
+import functools
 import inspect
 import os
 import subprocess
@@ -18,12 +19,27 @@ import luxtest_const
 ###############################################################################
 
 
+# the codec that last decoded successfully - on a given host, this is nearly always the same one, so try it first
+_preferred_codec = None
+
+
 def try_decode(input_bytes):
-    for codec in luxtest_const.CODEC_LIST:
+    global _preferred_codec
+
+    if _preferred_codec is not None:
         try:
-            return input_bytes.decode(codec)
+            return input_bytes.decode(_preferred_codec)
         except UnicodeDecodeError:
             pass
+    for codec in luxtest_const.CODEC_LIST:
+        if codec == _preferred_codec:
+            continue
+        try:
+            decoded = input_bytes.decode(codec)
+        except UnicodeDecodeError:
+            continue
+        _preferred_codec = codec
+        return decoded
     return input_bytes
 
 
@@ -49,6 +65,19 @@ def get_render_dirs() -> Tuple[str, ...]:
 def get_image_path(light_name, renderer: str, frame: int, ext: str, prefix="", renders_root=""):
     if not renders_root:
         renders_root = get_renders_root()
+    return _get_image_path(light_name, renderer, frame, ext, prefix, renders_root)
+
+
+def get_image_url(light_name, renderer: str, frame: int, ext: str, prefix="", renders_root=""):
+    if not renders_root:
+        renders_root = get_renders_root()
+    return _get_image_url(light_name, renderer, frame, ext, prefix, renders_root)
+
+
+# these are pure for a given (resolved) renders_root, and are called for every image several times (ie, by
+# gendiffs.py, when checking for updates, then again when making the html), so cache them
+@functools.lru_cache(maxsize=None)
+def _get_image_path(light_name, renderer: str, frame: int, ext: str, prefix: str, renders_root: str):
     ext = ext.lstrip(".")
     filename = f"{prefix}{light_name}-{renderer}.{frame:04}.{ext}"
     if ext == "png":
@@ -60,10 +89,9 @@ def get_image_path(light_name, renderer: str, frame: int, ext: str, prefix="", r
     return os.path.join(base_dir, filename)
 
 
-def get_image_url(light_name, renderer: str, frame: int, ext: str, prefix="", renders_root=""):
-    if not renders_root:
-        renders_root = get_renders_root()
-    image_path = get_image_path(light_name, renderer, frame, ext, prefix=prefix, renders_root=renders_root)
+@functools.lru_cache(maxsize=None)
+def _get_image_url(light_name, renderer: str, frame: int, ext: str, prefix: str, renders_root: str):
+    image_path = _get_image_path(light_name, renderer, frame, ext, prefix, renders_root)
     rel_path = os.path.relpath(image_path, luxtest_const.WEB_ROOT)
     return rel_path.replace(os.sep, "/")
 
@@ -124,10 +152,10 @@ class FrameRange(NamedTuple):
         return cls(*frames)
 
     def iter_frames(self):
-        """Returns an iterator over every frame in the range
+        """Returns an iterable over every frame in the range
 
         As a tuple, an iterator is already defined, as (start, end); this
         is different from that, as it iterates over interior frames (and won't
         repeat start/end if they're the same)
         """
-        return iter(range(self.start, self.end + 1))
+        return range(self.start, self.end + 1)